@@ -1,8 +1,131 @@
 import pyodbc
 import os
-import csv
+import gzip
+import io
+import queue
+import re
+import shutil
+import subprocess
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Optional, Tuple, Any, Iterator
+from typing import Dict, List, Optional, Set, Tuple, Any, BinaryIO, Iterator
+
+try:
+    # Optional: columnar ODBC -> CSV/Parquet export without per-cell Python objects
+    import arrow_odbc
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:
+    arrow_odbc = None
+
+try:
+    # Optional: chunked DataFrame export with pandas' C-level CSV writer
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    # Optional: batched file writes through io_uring (Linux only)
+    import liburing
+except ImportError:
+    liburing = None
+
+
+WRITE_BUFFER_SIZE: int = 1024 * 1024  # Output file buffer (bytes)
+PROGRESS_EVERY_ROWS: int = 100_000  # Print progress once per this many rows
+IO_URING_ENTRIES: int = 32  # Max. writes in flight per file
+IO_URING_SUBMIT_BATCH: int = 8  # Writes queued per io_uring_submit call
+
+
+class _IoUringWriter(io.RawIOBase):
+    """
+    Write-only file that sends writes to the kernel through io_uring.
+
+    Writes are queued and submitted in groups, so one syscall covers
+    several writes. Completions are reaped only when the ring is full
+    or the file is closed.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Create (or truncate) the file and set up the ring.
+
+        Args:
+            path: Target file path
+        """
+        super().__init__()
+        self._fd: int = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            self._ring = liburing.Ring()
+            self._cqe = liburing.Cqe()
+            liburing.io_uring_queue_init(IO_URING_ENTRIES, self._ring)
+        except BaseException:
+            os.close(self._fd)
+            super().close()  # Nothing left to release in close()
+            raise
+        self._offset: int = 0
+        self._queued: int = 0  # Prepared but not yet submitted writes
+        self._in_flight: List[bytes] = []  # Buffers must live until completion
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        """Queue a write at the current end of file."""
+        buf: bytes = bytes(data)  # Copy: the caller may reuse its buffer
+        sqe = liburing.io_uring_get_sqe(self._ring)
+        liburing.io_uring_prep_write(sqe, self._fd, buf, self._offset)
+        self._offset += len(buf)
+        self._in_flight.append(buf)
+        self._queued += 1
+
+        if self._queued >= IO_URING_SUBMIT_BATCH:
+            liburing.io_uring_submit(self._ring)
+            self._queued = 0
+        if len(self._in_flight) >= IO_URING_ENTRIES:
+            self._wait_all()
+        return len(buf)
+
+    def _wait_all(self) -> None:
+        """Submit queued writes and wait until all writes have completed."""
+        if self._queued:
+            liburing.io_uring_submit(self._ring)
+            self._queued = 0
+
+        expected: int = sum(len(buf) for buf in self._in_flight)
+        written: int = 0
+        done: int = 0
+        while done < len(self._in_flight):
+            liburing.io_uring_wait_cqe(self._ring, self._cqe)
+            ready: int = liburing.io_uring_cq_ready(self._ring)
+            results: List[int] = [self._cqe[i].res for i in range(ready)]
+            liburing.io_uring_cq_advance(self._ring, ready)
+            done += ready
+            for res in results:
+                if res < 0:
+                    raise OSError(-res, os.strerror(-res))
+                written += res
+
+        self._in_flight.clear()
+        if written != expected:
+            raise OSError(f"Short write: {written} of {expected} bytes")
+
+    def close(self) -> None:
+        """Wait for pending writes, then release the ring and the file."""
+        if self.closed:
+            return
+        try:
+            self._wait_all()
+        finally:
+            # Mark closed even if a write failed, so close() (e.g. from
+            # __del__) never touches the torn down ring or fd again
+            try:
+                liburing.io_uring_queue_exit(self._ring)
+                os.close(self._fd)
+            finally:
+                super().close()
 
 
 class WinCC_AlarmLogging_Exporter:
@@ -11,14 +134,82 @@ class WinCC_AlarmLogging_Exporter:
     Exports target views from all databases containing '_ALG_' in their names.
     """
 
-    def __init__(self, server: str = "") -> None:
+    def __init__(self,
+                 server: str = "",
+                 max_workers: int = 4,
+                 fetch_batch_size: int = 10_000,
+                 use_arrow: bool = False,
+                 driver: str = "ODBC Driver 18 for SQL Server",
+                 compress: bool = False,
+                 use_bcp: bool = False,
+                 use_pandas: bool = False,
+                 view_workers: int = 3,
+                 datetime_precision: Optional[int] = None,
+                 float_precision: Optional[int] = None,
+                 use_io_uring: bool = False,
+                 output_format: str = "csv",
+                 read_uncommitted: bool = False) -> None:
         """
         Initialize the exporter with server connection information.
 
         Args:
             server: SQL Server instance name (default: local WINCC instance)
+            max_workers: Number of databases exported in parallel
+            fetch_batch_size: Rows fetched per round trip (tune per deployment)
+            use_arrow: Export views with arrow-odbc/pyarrow if installed
+                       (falls back to pyodbc otherwise). Output differs from
+                       the pyodbc path: header and all string cells are
+                       quoted. Each view opens its own connection (not pooled)
+            driver: ODBC driver name (e.g. "ODBC Driver 17 for SQL Server",
+                    or the legacy "SQL Server")
+            compress: Write gzip-compressed files (.csv.gz) to save disk/network I/O
+            use_bcp: Export views with the native bcp utility if it is on PATH
+                     (not used together with compress). bcp writes no header
+                     row and does not quote cells: text containing ';' or
+                     line breaks makes the CSV unreadable, so only use it for
+                     views known to be free of such text. bcp 18+ is run with
+                     optional encryption and a trusted server certificate
+                     (-Yo -u), matching the ODBC connection settings
+            use_pandas: Export views with pandas read_sql/to_csv if installed.
+                        (pandas >= 2.0). Numbers and datetimes are formatted
+                        by pandas; integer columns stay integers with NULLs
+            view_workers: Number of views of one database exported in parallel
+                          (each on its own pooled connection)
+            datetime_precision: Fractional second digits written for datetimes
+                                (0-6; default None keeps full precision)
+            float_precision: Decimal places written for floats, trailing zeros
+                             dropped, never in exponent form (default None
+                             keeps full precision). Both precision options
+                             only apply to the pyodbc export path; arrow,
+                             pandas and bcp ignore them
+            use_io_uring: Write files through io_uring if liburing is installed
+                          (Linux only; not used together with compress)
+            output_format: "csv" or "parquet" (zstd-compressed, needs arrow-odbc)
+            read_uncommitted: Read views WITH (NOLOCK) on every export path, so
+                              exports don't wait for (or block) WinCC Runtime
+                              writing alarms. Exports may then contain rows
+                              of inserts that are not committed yet
         """
+        if output_format not in ("csv", "parquet"):
+            raise ValueError(f"Unknown output format: {output_format}")
+        if output_format == "parquet" and arrow_odbc is None:
+            raise ImportError("Parquet export requires arrow-odbc and pyarrow")
+
         self.server: str = server or os.environ['COMPUTERNAME'] + "\\WINCC"
+        self.max_workers: int = max_workers
+        self.view_workers: int = view_workers
+        self.fetch_batch_size: int = fetch_batch_size
+        self.use_arrow: bool = use_arrow and arrow_odbc is not None
+        self.driver: str = driver
+        self.compress: bool = compress
+        self.output_format: str = output_format
+        self.read_uncommitted: bool = read_uncommitted
+        self.use_io_uring: bool = use_io_uring and liburing is not None and not compress
+        self.bcp_path: Optional[str] = shutil.which("bcp") if use_bcp and not compress else None
+        self._bcp_encryption_args: Optional[List[str]] = None  # Detected on first use
+        self.use_pandas: bool = use_pandas and pd is not None
+        self.datetime_precision: Optional[int] = datetime_precision
+        self.float_precision: Optional[int] = float_precision
         self.target_views: List[str] = [
             "AlgViewENU_ID_OPT",  # English view
             "AlgViewRUS_ID_OPT",  # Russian view
@@ -27,6 +218,8 @@ class WinCC_AlarmLogging_Exporter:
         ]
         self.conn: Optional[pyodbc.Connection] = None  # Database connection
         self.cur: Optional[pyodbc.Cursor] = None  # Database cursor
+        self._pool: queue.Queue = queue.Queue()  # Reusable worker connections
+        self._alg_databases: Set[str] = set()  # Known databases (for USE)
 
     def export_alarmlogging_data(self, output_dir: str = "wincc_alarmlogging_export") -> None:
         """
@@ -38,6 +231,7 @@ class WinCC_AlarmLogging_Exporter:
         try:
             self._connect_to_master()
             alg_databases: List[str] = self._get_alg_databases()
+            self._alg_databases = set(alg_databases)
 
             if not alg_databases:
                 print("No databases with '_ALG_' in name found!")
@@ -45,23 +239,105 @@ class WinCC_AlarmLogging_Exporter:
 
             os.makedirs(output_dir, exist_ok=True)
 
-            for db_name in alg_databases:
-                self._process_database_views(db_name, output_dir)
+            # Find target views in all databases at once; databases
+            # without any of them are skipped entirely
+            view_map: Optional[Dict[str, Set[str]]] = self._get_alg_view_map(alg_databases)
+            if view_map is not None:
+                for db_name in alg_databases:
+                    if db_name not in view_map:
+                        print(f"No target views found in {db_name}")
+                alg_databases = [db_name for db_name in alg_databases if db_name in view_map]
+
+            # Each worker thread uses its own pooled connection, so the
+            # (I/O-bound) exports can safely run in parallel threads
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        self._process_database_views,
+                        db_name,
+                        output_dir,
+                        view_map[db_name] if view_map is not None else None
+                    ): db_name
+                    for db_name in alg_databases
+                }
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        print(f"Error processing {futures[future]}: {e}")
 
         finally:
             self.close()
 
     def _connect_to_master(self) -> None:
         """Establish connection to master database to find other databases. Set cursor"""
-        self.conn = pyodbc.connect(
-            f"DRIVER={{SQL Server}};"
+        self.conn = self._connect()
+        self.cur = self.conn.cursor()
+
+    def _connect(self) -> pyodbc.Connection:
+        """
+        Open a connection to master set up for plain reads: autocommit,
+        no implicit transactions and no row count messages.
+
+        Returns:
+            New database connection
+        """
+        conn: pyodbc.Connection = pyodbc.connect(
+            self._connection_string("master"),
+            autocommit=True
+        )
+        conn.cursor().execute("SET NOCOUNT ON; SET IMPLICIT_TRANSACTIONS OFF")
+        return conn
+
+    def _connection_string(self, db_name: str) -> str:
+        """Build the ODBC connection string for a single database."""
+        return (
+            f"DRIVER={{{self.driver}}};"
             f"SERVER={self.server};"
-            f"DATABASE=master;"
+            f"DATABASE={db_name};"
             f"Trusted_Connection=yes;"
-            f"Encrypt=no;TrustServerCertificate=yes;",
-            autocommit=True
+            f"Packet Size=32768;"  # Max TDS packet, less framing on large results
+            f"Encrypt=no;TrustServerCertificate=yes;"
         )
-        self.cur = self.conn.cursor()
+
+    def _acquire_connection(self, db_name: str) -> pyodbc.Connection:
+        """
+        Take a connection from the pool (or open a new one) and switch it
+        to the given database.
+
+        Args:
+            db_name: Database to switch to (must come from sys.databases)
+
+        Returns:
+            Connection with db_name as current database
+        """
+        if db_name not in self._alg_databases:
+            raise ValueError(f"Unknown database: {db_name}")
+
+        use_db: str = f"USE [{db_name.replace(']', ']]')}]"
+        try:
+            conn: pyodbc.Connection = self._pool.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        else:
+            try:
+                conn.cursor().execute(use_db)
+                return conn
+            except Exception:
+                # Pooled connection went stale: drop it and reconnect once
+                conn.close()
+                conn = self._connect()
+
+        try:
+            conn.cursor().execute(use_db)
+        except Exception:
+            conn.close()
+            raise
+        return conn
+
+    def _release_connection(self, conn: pyodbc.Connection) -> None:
+        """Return a connection to the pool for reuse by other databases."""
+        self._pool.put(conn)
 
     def _get_alg_databases(self) -> List[str]:
         """Retrieve list of all _ALG_ databases that are online."""
@@ -74,60 +350,132 @@ class WinCC_AlarmLogging_Exporter:
         """)
         return [row[0] for row in self.cur.fetchall()]
 
-    def _process_database_views(self, db_name: str, output_dir: str) -> None:
+    def _get_alg_view_map(self, alg_databases: List[str]) -> Optional[Dict[str, Set[str]]]:
+        """
+        Find target views in all given databases with a single query on master.
+
+        Args:
+            alg_databases: Databases to search
+
+        Returns:
+            Mapping of database name to its existing target views
+            (databases without target views are omitted), or None if the
+            combined query failed, e.g. because one database is inaccessible
+        """
+        def literal(value: str) -> str:
+            return "N'" + value.replace("'", "''") + "'"
+
+        view_list: str = ", ".join(literal(view_name) for view_name in self.target_views)
+        query: str = "\nUNION ALL\n".join(
+            f"SELECT {literal(db_name)}, TABLE_NAME "
+            f"FROM [{db_name.replace(']', ']]')}].INFORMATION_SCHEMA.VIEWS "
+            f"WHERE TABLE_NAME IN ({view_list})"
+            for db_name in alg_databases
+        )
+
+        try:
+            self.cur.execute(query)
+            rows: List[Tuple[Any, ...]] = self.cur.fetchall()
+        except pyodbc.Error as e:
+            print(f"Could not list views across databases, checking one by one: {e}")
+            return None
+
+        view_map: Dict[str, Set[str]] = {}
+        for db_name, view_name in rows:
+            view_map.setdefault(db_name, set()).add(view_name)
+        return view_map
+
+    def _process_database_views(self,
+                                db_name: str,
+                                output_dir: str,
+                                existing_views: Optional[Set[str]] = None) -> None:
         """
         Process and export views from a single database.
 
         Args:
             db_name: Database name to process
             output_dir: Base output directory for exports
+            existing_views: Target views known to exist (looked up if None)
         """
+        conn: Optional[pyodbc.Connection] = None
         try:
             print(f"\n🔍 Checking database: {db_name}")
-            conn: pyodbc.Connection = pyodbc.connect(
-                f"DRIVER={{SQL Server}};"
-                f"SERVER={self.server};"
-                f"DATABASE={db_name};"
-                f"Trusted_Connection=yes;",
-                autocommit=True
-            )
-            cur: pyodbc.Cursor = conn.cursor()
 
-            # Check for target views
+            # Check for target views (one round trip for all of them)
+            if existing_views is None:
+                conn = self._acquire_connection(db_name)
+                existing_views = self._get_existing_views(conn.cursor())
+                # Hand the connection back so a view worker can reuse it
+                self._release_connection(conn)
+                conn = None
             for view_name in self.target_views:
-                if self._check_view_exists(cur, view_name):
-                    self._export_view(cur, db_name, view_name, output_dir)
-                else:
+                if view_name not in existing_views:
                     print(f"View {view_name} not found in {db_name}")
 
+            # Export views concurrently; pyodbc connections must not be
+            # shared between threads, so each view takes its own
+            views: List[str] = [v for v in self.target_views if v in existing_views]
+            with ThreadPoolExecutor(max_workers=self.view_workers) as executor:
+                list(executor.map(
+                    lambda view_name: self._export_view_pooled(db_name, view_name, output_dir),
+                    views
+                ))
+
         except Exception as e:
             print(f"Error processing {db_name}: {e}")
+            # Don't hand a possibly broken connection to the next database
+            if conn:
+                conn.close()
+                conn = None
         finally:
+            if conn:
+                self._release_connection(conn)
+
+    def _export_view_pooled(self, db_name: str, view_name: str, output_dir: str) -> None:
+        """
+        Export a view on a connection taken from the pool.
+
+        Args:
+            db_name: Source database name
+            view_name: View to export
+            output_dir: Base output directory
+        """
+        conn: pyodbc.Connection = self._acquire_connection(db_name)
+        try:
+            exported: bool = self._export_view(conn.cursor(), db_name, view_name, output_dir)
+        except Exception:
             conn.close()
+            raise
 
-    def _check_view_exists(self, cursor: pyodbc.Cursor, view_name: str) -> bool:
+        # Don't hand a possibly broken connection to the next view
+        if exported:
+            self._release_connection(conn)
+        else:
+            conn.close()
+
+    def _get_existing_views(self, cursor: pyodbc.Cursor) -> Set[str]:
         """
-        Check if a view exists in the database.
+        Find which target views exist in the current database.
 
         Args:
             cursor: Database cursor
-            view_name: Name of view to check
 
         Returns:
-            True if view exists, False otherwise
+            Names of target views that exist
         """
-        cursor.execute("""
-            SELECT 1 
+        placeholders: str = ", ".join("?" for _ in self.target_views)
+        cursor.execute(f"""
+            SELECT TABLE_NAME 
             FROM INFORMATION_SCHEMA.VIEWS 
-            WHERE TABLE_NAME = ?
-        """, view_name)
-        return cursor.fetchone() is not None
+            WHERE TABLE_NAME IN ({placeholders})
+        """, *self.target_views)
+        return {row[0] for row in cursor.fetchall()}
 
     def _export_view(self,
                      cursor: pyodbc.Cursor,
                      db_name: str,
                      view_name: str,
-                     output_dir: str) -> None:
+                     output_dir: str) -> bool:
         """
         Export data from a view to CSV file.
 
@@ -136,38 +484,360 @@ class WinCC_AlarmLogging_Exporter:
             db_name: Source database name
             view_name: View to export
             output_dir: Base output directory
+
+        Returns:
+            True if the view was exported (or is empty), False on error
         """
         try:
+            # Skip empty views without creating any files
+            cursor.execute(f"SELECT TOP 1 1 FROM {self._view_source(view_name)}")
+            has_rows: bool = cursor.fetchone() is not None
+            # Close the probe so its result set doesn't keep the connection
+            # busy (e.g. for pandas, which opens its own statement)
+            connection: pyodbc.Connection = cursor.connection
+            cursor.close()
+            if not has_rows:
+                print(f"ℹ️ Empty: {db_name}/{view_name}")
+                return True
+            cursor = connection.cursor()
+
             # Create database-specific directory
             db_dir: str = os.path.join(output_dir, db_name)
             os.makedirs(db_dir, exist_ok=True)
 
+            if self.output_format == "parquet":
+                parquet_path: str = os.path.join(db_dir, f"{view_name}.parquet")
+                self._export_view_parquet(db_name, view_name, parquet_path)
+                print(f"✅ Success: {db_name}/{view_name}")
+                return True
+
             csv_path: str = os.path.join(db_dir, f"{view_name}.csv")
 
-            # Get data from view
-            cursor.execute(f"SELECT * FROM [{view_name}]")
-            columns: List[str] = [column[0] for column in cursor.description]
+            if self.bcp_path:
+                self._export_view_bcp(db_name, view_name, csv_path)
+            elif self.use_arrow:
+                self._export_view_arrow(db_name, view_name, csv_path)
+            elif self.use_pandas:
+                self._export_view_pandas(cursor, view_name, csv_path)
+            else:
+                self._export_view_pyodbc(cursor, db_name, view_name, csv_path)
+
+            print(f"✅ Success: {db_name}/{view_name}")
+            return True
 
-            with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-                writer: csv.writer = csv.writer(f, delimiter=';')
-                writer.writerow(columns)
+        except Exception as e:
+            print(f"❌ Error exporting {view_name}: {e}")
+            return False
 
-                # Export data in batches
-                while True:
-                    batch: List[Tuple[Any, ...]] = cursor.fetchmany(10_000)
+    def _view_source(self, view_name: str) -> str:
+        """
+        Quote a view name for use in FROM, with the NOLOCK hint if
+        read_uncommitted is enabled (hints on views apply to their tables).
+
+        Args:
+            view_name: View name
+
+        Returns:
+            FROM clause source, e.g. "[AlgViewENU_ID_OPT] WITH (NOLOCK)"
+        """
+        source: str = f"[{view_name.replace(']', ']]')}]"
+        return source + " WITH (NOLOCK)" if self.read_uncommitted else source
+
+    def _export_view_pyodbc(self,
+                            cursor: pyodbc.Cursor,
+                            db_name: str,
+                            view_name: str,
+                            csv_path: str) -> None:
+        """
+        Export data from a view to CSV file using the pyodbc cursor.
+
+        Args:
+            cursor: Database cursor
+            db_name: Source database name
+            view_name: View to export
+            csv_path: Target CSV file path
+        """
+        # Get data from view
+        cursor.execute(f"SELECT * FROM {self._view_source(view_name)}")
+        columns: List[str] = [column[0] for column in cursor.description]
+
+        rows_written: int = 0
+        next_progress: int = PROGRESS_EVERY_ROWS
+
+        with self._open_output(csv_path) as f:
+            f.write(self._format_rows([columns]))
+
+            # Export data in batches (fetched in a background thread)
+            for batch in self._iter_batches(cursor):
+                f.write(self._format_rows(batch))
+                rows_written += len(batch)
+                if rows_written >= next_progress:
+                    print(f"   {db_name}/{view_name}: {rows_written:,} rows")
+                    next_progress = rows_written + PROGRESS_EVERY_ROWS
+
+    @staticmethod
+    def _quote_cell(cell: str) -> str:
+        """Quote a CSV cell the way csv.writer does (QUOTE_MINIMAL)."""
+        if ';' in cell or '"' in cell or '\n' in cell or '\r' in cell:
+            return '"' + cell.replace('"', '""') + '"'
+        return cell
+
+    def _format_cell(self, value: Any) -> str:
+        """
+        Format a single cell value, shortening datetimes and floats to the
+        configured precision.
+
+        Args:
+            value: Cell value
+
+        Returns:
+            Text representation of the value
+        """
+        if value is None:
+            return ""
+        if isinstance(value, datetime) and self.datetime_precision is not None \
+                and value.tzinfo is None:
+            # "YYYY-MM-DD HH:MM:SS.ffffff" cut to the wanted fraction digits
+            text: str = value.isoformat(sep=' ', timespec='microseconds')
+            return text[:19] if self.datetime_precision <= 0 else text[:20 + self.datetime_precision]
+        if isinstance(value, float) and self.float_precision is not None:
+            # Fixed point: rounds decimals only, integer digits are kept
+            text = format(value, f".{self.float_precision}f")
+            if '.' in text:
+                text = text.rstrip('0').rstrip('.')
+            return "0" if text == "-0" else text
+        return str(value)
+
+    def _format_rows(self, rows: List[Tuple[Any, ...]]) -> bytes:
+        """
+        Format rows as ';'-separated UTF-8 CSV lines.
+
+        Cells are joined directly; only rows that contain a separator,
+        quote or line break go through the (slower) quoting path.
+
+        Args:
+            rows: Rows to format
+
+        Returns:
+            Encoded CSV lines, each terminated with CRLF
+        """
+        lines: List[str] = []
+        for row in rows:
+            cells: List[str] = [self._format_cell(value) for value in row]
+            line: str = ";".join(cells)
+            if (line.count(';') >= len(cells) or '"' in line
+                    or '\n' in line or '\r' in line):
+                line = ";".join(self._quote_cell(cell) for cell in cells)
+            elif line == "" and len(cells) == 1:
+                # csv.writer quotes a lone empty cell so the line isn't blank
+                line = '""'
+            lines.append(line)
+        return ("\r\n".join(lines) + "\r\n").encode('utf-8')
+
+    def _open_output(self, csv_path: str) -> BinaryIO:
+        """
+        Open a buffered binary output file, gzip-compressed if enabled.
+
+        Args:
+            csv_path: Target CSV file path (".gz" is appended when compressing)
+
+        Returns:
+            Writable binary file object
+        """
+        if self.compress:
+            # Level 1: compression is rarely worth more CPU than this here
+            gz: gzip.GzipFile = gzip.GzipFile(csv_path + ".gz", 'wb', compresslevel=1)
+            return io.BufferedWriter(gz, WRITE_BUFFER_SIZE)
+        if self.use_io_uring:
+            try:
+                return io.BufferedWriter(_IoUringWriter(csv_path), WRITE_BUFFER_SIZE)
+            except OSError as e:
+                # e.g. io_uring disabled by sysctl or a seccomp profile
+                print(f"io_uring not available, using regular file writes: {e}")
+                self.use_io_uring = False
+        return open(csv_path, 'wb', buffering=WRITE_BUFFER_SIZE)
+
+    def _iter_batches(self, cursor: pyodbc.Cursor) -> Iterator[List[Tuple[Any, ...]]]:
+        """
+        Yield row batches from a cursor, fetching the next batch in a
+        background thread while the caller writes the current one.
+
+        pyodbc releases the GIL during fetches, so fetching and CSV writing
+        overlap. The bounded queue keeps at most two batches in memory.
+
+        Args:
+            cursor: Database cursor with an executed query
+
+        Yields:
+            Lists of rows, until the result set is exhausted
+        """
+        batches: queue.Queue = queue.Queue(maxsize=2)
+        stop: threading.Event = threading.Event()
+
+        def put(item: Any) -> None:
+            # Don't block forever if the consumer has already given up
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def producer() -> None:
+            try:
+                while not stop.is_set():
+                    batch: List[Tuple[Any, ...]] = cursor.fetchmany(self.fetch_batch_size)
+                    put(batch)
                     if not batch:
                         break
-                    writer.writerows(batch)
+            except Exception as e:
+                put(e)
 
-            print(f"✅ Success: {db_name}/{view_name}")
+        thread: threading.Thread = threading.Thread(target=producer, daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = batches.get()
+                if isinstance(item, Exception):
+                    raise item
+                if not item:
+                    return
+                yield item
+        finally:
+            stop.set()
+            thread.join()
 
-        except Exception as e:
-            print(f"❌ Error exporting {view_name}: {e}")
+    def _export_view_arrow(self, db_name: str, view_name: str, csv_path: str) -> None:
+        """
+        Export data from a view to CSV file using arrow-odbc.
+
+        Batches stay columnar (Arrow) from the ODBC driver to the CSV writer.
+
+        Args:
+            db_name: Source database name
+            view_name: View to export
+            csv_path: Target CSV file path
+        """
+        reader = arrow_odbc.read_arrow_batches_from_odbc(
+            query=f"SELECT * FROM {self._view_source(view_name)}",
+            connection_string=self._connection_string(db_name),
+            batch_size=self.fetch_batch_size
+        )
+        # CRLF like the pyodbc path; pyarrow has no minimal quoting for
+        # strings, so header and string cells are always quoted
+        write_options = pa_csv.WriteOptions(delimiter=';', eol='\r\n')
+
+        with self._open_output(csv_path) as f:
+            with pa_csv.CSVWriter(f, reader.schema, write_options=write_options) as writer:
+                for batch in reader:
+                    writer.write_batch(batch)
+
+    def _export_view_parquet(self, db_name: str, view_name: str, parquet_path: str) -> None:
+        """
+        Export data from a view to Parquet file using arrow-odbc.
+
+        Args:
+            db_name: Source database name
+            view_name: View to export
+            parquet_path: Target Parquet file path
+        """
+        reader = arrow_odbc.read_arrow_batches_from_odbc(
+            query=f"SELECT * FROM {self._view_source(view_name)}",
+            connection_string=self._connection_string(db_name),
+            batch_size=self.fetch_batch_size
+        )
+
+        with pq.ParquetWriter(parquet_path, reader.schema, compression='zstd') as writer:
+            for batch in reader:
+                writer.write_batch(batch)
+
+    def _export_view_pandas(self, cursor: pyodbc.Cursor, view_name: str, csv_path: str) -> None:
+        """
+        Export data from a view to CSV file using pandas.
+
+        Args:
+            cursor: Database cursor (its connection is used for read_sql)
+            view_name: View to export
+            csv_path: Target CSV file path
+        """
+        with warnings.catch_warnings():
+            # pandas warns about every non-SQLAlchemy connection; pyodbc works
+            warnings.filterwarnings("ignore", message="pandas only supports SQLAlchemy")
+            chunks = pd.read_sql(
+                f"SELECT * FROM {self._view_source(view_name)}",
+                cursor.connection,
+                chunksize=self.fetch_batch_size,
+                # Nullable dtypes: an INT column with NULLs stays integer
+                # instead of turning into floats (1.0) in some chunks only
+                dtype_backend="numpy_nullable"
+            )
+
+        # The file is opened (and truncated) once; chunks are appended to it
+        with self._open_output(csv_path) as f:
+            header: bool = True
+            for chunk in chunks:
+                chunk.to_csv(f, sep=';', header=header, index=False,
+                             mode='wb', encoding='utf-8', lineterminator='\r\n')
+                header = False
+
+    def _export_view_bcp(self, db_name: str, view_name: str, csv_path: str) -> None:
+        """
+        Export data from a view to CSV file using the bcp utility.
+
+        Rows go straight from SQL Server to disk without Python objects.
+        bcp writes no header row and does not quote cells containing the
+        separator or line breaks.
+
+        Args:
+            db_name: Source database name
+            view_name: View to export
+            csv_path: Target CSV file path
+        """
+        db: str = db_name.replace(']', ']]')
+        result: subprocess.CompletedProcess = subprocess.run([
+            self.bcp_path,
+            # Default schema, like the other paths
+            f"SELECT * FROM [{db}]..{self._view_source(view_name)}",
+            "queryout", csv_path,
+            "-S", self.server,
+            "-T",           # Trusted connection
+            "-c",           # Character mode
+            "-t;",          # Field terminator
+            "-C", "65001",  # UTF-8
+            "-a", "32768",  # Packet size
+            *self._get_bcp_encryption_args(),
+        ], capture_output=True, text=True)
+
+        if result.returncode != 0:
+            # bcp reports its errors on stdout
+            output: str = (result.stdout + result.stderr).strip()
+            raise RuntimeError(f"bcp failed with exit code {result.returncode}: {output}")
+
+    def _get_bcp_encryption_args(self) -> List[str]:
+        """
+        Get bcp options matching Encrypt=no;TrustServerCertificate=yes.
+
+        bcp 18 encrypts by default and rejects self-signed certificates,
+        while older versions don't know these options.
+
+        Returns:
+            ["-Yo", "-u"] for bcp 18 and newer, otherwise an empty list
+        """
+        if self._bcp_encryption_args is None:
+            version: subprocess.CompletedProcess = subprocess.run(
+                [self.bcp_path, "-v"], capture_output=True, text=True
+            )
+            match: Optional[re.Match] = re.search(r"Version:?\s*(\d+)", version.stdout)
+            major: int = int(match.group(1)) if match else 0
+            self._bcp_encryption_args = ["-Yo", "-u"] if major >= 18 else []
+        return self._bcp_encryption_args
 
     def close(self) -> None:
-        """Close database connection if it exists."""
+        """Close database connection and pooled connections if they exist."""
         if self.conn:
             self.conn.close()
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,275 @@
+import csv
+import errno
+import io
+import os
+import sys
+import threading
+import types
+from datetime import datetime
+
+import pytest
+
+try:
+    import pyodbc  # noqa: F401
+except ImportError:
+    # Formatting and file writing don't need a database driver
+    pyodbc_stub = types.ModuleType("pyodbc")
+    pyodbc_stub.Connection = object
+    pyodbc_stub.Cursor = object
+    pyodbc_stub.Error = Exception
+    sys.modules["pyodbc"] = pyodbc_stub
+
+import main
+
+
+@pytest.fixture
+def exporter() -> main.WinCC_AlarmLogging_Exporter:
+    return main.WinCC_AlarmLogging_Exporter("localhost\\WINCC")
+
+
+class FakeCursor:
+    """Cursor returning `total` numbered rows (endless if None)."""
+
+    def __init__(self, total=None, fail_after=None):
+        self.total = total
+        self.fail_after = fail_after
+        self.fetched = 0
+
+    def fetchmany(self, size):
+        if self.fail_after is not None and self.fetched >= self.fail_after:
+            raise RuntimeError("connection lost")
+        end = self.fetched + size if self.total is None else min(self.fetched + size, self.total)
+        batch = [(i,) for i in range(self.fetched, end)]
+        self.fetched = end
+        return batch
+
+
+class FakeConnection:
+    """Connection whose statements fail once it is marked broken."""
+
+    def __init__(self, broken=False):
+        self.broken = broken
+        self.closed = False
+
+    def cursor(self):
+        connection = self
+
+        class Cursor:
+            def execute(self, sql, *params):
+                if connection.broken:
+                    raise RuntimeError("communication link failure")
+
+        return Cursor()
+
+    def close(self):
+        self.closed = True
+
+
+def csv_writer_output(rows) -> bytes:
+    buffer = io.StringIO(newline='')
+    csv.writer(buffer, delimiter=';').writerows(rows)
+    return buffer.getvalue().encode('utf-8')
+
+
+@pytest.mark.parametrize("rows", [
+    [(1, "text", 2.5, datetime(2024, 3, 5, 10, 22, 17, 123456))],
+    [(1, "a;b"), (2, 'say "hi"'), (3, "line\nbreak"), (4, "carriage\rreturn")],
+    [(None, ""), ("", None), (None,), ("",), ()],
+    [("Ümlaut", "Кириллица", "€")],
+])
+def test_format_rows_matches_csv_writer(exporter, rows):
+    assert exporter._format_rows(rows) == csv_writer_output(rows)
+
+
+def test_format_cell_keeps_full_precision_by_default(exporter):
+    assert exporter._format_cell(123456789.0) == "123456789.0"
+    assert exporter._format_cell(0.1 + 0.2) == str(0.1 + 0.2)
+    assert exporter._format_cell(datetime(2024, 3, 5, 10, 22, 17, 123456)) == \
+        "2024-03-05 10:22:17.123456"
+
+
+def test_format_cell_precision(exporter):
+    exporter.datetime_precision = 3
+    exporter.float_precision = 6
+
+    assert exporter._format_cell(datetime(2024, 3, 5, 10, 22, 17, 123456)) == \
+        "2024-03-05 10:22:17.123"
+    assert exporter._format_cell(datetime(2024, 1, 1)) == "2024-01-01 00:00:00.000"
+    assert exporter._format_cell(123456789.0) == "123456789"
+    assert exporter._format_cell(1234567.0) == "1234567"
+    assert exporter._format_cell(0.12345678901234568) == "0.123457"
+    assert exporter._format_cell(1.5) == "1.5"
+    assert exporter._format_cell(-1e-9) == "0"
+
+    exporter.datetime_precision = 0
+    assert exporter._format_cell(datetime(2024, 3, 5, 10, 22, 17, 123456)) == \
+        "2024-03-05 10:22:17"
+
+
+def test_io_uring_writer_round_trip(tmp_path):
+    pytest.importorskip("liburing")
+    path = tmp_path / "out.csv"
+    chunks = [b"header\r\n", b"x" * (main.WRITE_BUFFER_SIZE + 1), b"", b"tail\r\n"]
+    chunks *= main.IO_URING_ENTRIES  # More writes than the ring holds at once
+
+    with io.BufferedWriter(main._IoUringWriter(str(path)), main.WRITE_BUFFER_SIZE) as f:
+        for chunk in chunks:
+            f.write(chunk)
+
+    assert path.read_bytes() == b"".join(chunks)
+
+
+def fake_liburing(queue_init_error=None) -> types.SimpleNamespace:
+    def io_uring_queue_init(entries, ring):
+        if queue_init_error:
+            raise queue_init_error
+
+    return types.SimpleNamespace(
+        Ring=object,
+        Cqe=object,
+        io_uring_queue_init=io_uring_queue_init,
+        io_uring_queue_exit=lambda ring: None,
+    )
+
+
+def test_open_output_falls_back_when_io_uring_is_unavailable(exporter, tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "liburing", fake_liburing(OSError(errno.ENOSYS, "io_uring disabled")))
+    exporter.use_io_uring = True
+    path = tmp_path / "out.csv"
+
+    with exporter._open_output(str(path)) as f:
+        f.write(b"a;b\r\n")
+
+    assert path.read_bytes() == b"a;b\r\n"
+    assert not exporter.use_io_uring
+
+
+def test_io_uring_writer_closes_once_after_failed_write(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "liburing", fake_liburing())
+    closed_fds = []
+    real_close = os.close
+    monkeypatch.setattr(main.os, "close", lambda fd: (closed_fds.append(fd), real_close(fd)))
+
+    writer = main._IoUringWriter(str(tmp_path / "out.csv"))
+
+    def fail():
+        raise OSError(errno.EIO, "short write")
+
+    writer._wait_all = fail
+    with pytest.raises(OSError):
+        writer.close()
+    writer.close()
+
+    assert writer.closed
+    assert closed_fds == [writer._fd]
+
+
+def test_iter_batches_yields_all_rows(exporter):
+    exporter.fetch_batch_size = 7
+    rows = [row for batch in exporter._iter_batches(FakeCursor(total=100)) for row in batch]
+    assert rows == [(i,) for i in range(100)]
+
+
+def test_iter_batches_propagates_fetch_errors(exporter):
+    exporter.fetch_batch_size = 10
+    with pytest.raises(RuntimeError, match="connection lost"):
+        for _ in exporter._iter_batches(FakeCursor(fail_after=30)):
+            pass
+
+
+def test_iter_batches_stops_producer_on_early_exit(exporter):
+    exporter.fetch_batch_size = 10
+    threads_before = set(threading.enumerate())
+
+    batches = exporter._iter_batches(FakeCursor())
+    next(batches)
+    batches.close()
+
+    assert set(threading.enumerate()) == threads_before
+
+
+def test_acquire_connection_replaces_stale_pooled_connection(exporter, monkeypatch):
+    stale, fresh = FakeConnection(broken=True), FakeConnection()
+    monkeypatch.setattr(exporter, "_connect", lambda: fresh)
+    exporter._alg_databases = {"CC_ALG_1"}
+    exporter._release_connection(stale)
+
+    assert exporter._acquire_connection("CC_ALG_1") is fresh
+    assert stale.closed
+
+
+def test_export_view_pooled_drops_connection_after_failed_export(exporter, monkeypatch):
+    conn = FakeConnection()
+    monkeypatch.setattr(exporter, "_connect", lambda: conn)
+    monkeypatch.setattr(exporter, "_export_view", lambda *args: False)
+    exporter._alg_databases = {"CC_ALG_1"}
+
+    exporter._export_view_pooled("CC_ALG_1", "AlgViewENU_ID_OPT", "out")
+
+    assert conn.closed
+    assert exporter._pool.empty()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fake bcp is a shell script")
+def test_bcp_failure_reports_output_and_uses_bcp18_encryption_args(exporter, tmp_path):
+    fake_bcp = tmp_path / "bcp"
+    fake_bcp.write_text(
+        "#!/bin/sh\n"
+        "if [ \"$1\" = \"-v\" ]; then echo 'Version: 18.2.0001.1'; exit 0; fi\n"
+        "echo \"SQLState = 08001, args: $*\"\n"
+        "exit 1\n"
+    )
+    fake_bcp.chmod(0o755)
+    exporter.bcp_path = str(fake_bcp)
+
+    with pytest.raises(RuntimeError) as error:
+        exporter._export_view_bcp("CC_ALG_1", "AlgViewENU_ID_OPT", str(tmp_path / "out.csv"))
+
+    assert "SQLState = 08001" in str(error.value)
+    assert "-Yo -u" in str(error.value)
+
+
+class FakeDbApiConnection:
+    """Minimal DB-API connection serving one fixed result set."""
+
+    def __init__(self, columns, rows):
+        self.columns = columns
+        self.rows = rows
+
+    def cursor(self):
+        connection = self
+
+        class Cursor:
+            description = [(name, None, None, None, None, None, None)
+                           for name in connection.columns]
+
+            def execute(self, sql, *params):
+                self.remaining = list(connection.rows)
+
+            def fetchmany(self, size):
+                batch, self.remaining = self.remaining[:size], self.remaining[size:]
+                return batch
+
+            def fetchall(self):
+                return self.fetchmany(len(self.remaining))
+
+            def close(self):
+                pass
+
+        return Cursor()
+
+    def commit(self):
+        pass
+
+
+def test_export_view_pandas_keeps_integers_across_chunks(exporter, tmp_path):
+    if main.pd is None:
+        pytest.skip("pandas is not installed")
+    exporter.fetch_batch_size = 2
+    connection = FakeDbApiConnection(["ID", "Text"], [(1, "a"), (None, "b;c"), (3, "d")])
+    cursor = types.SimpleNamespace(connection=connection)
+    csv_path = tmp_path / "out.csv"
+
+    exporter._export_view_pandas(cursor, "AlgViewENU_ID_OPT", str(csv_path))
+
+    assert csv_path.read_bytes() == b'ID;Text\r\n1;a\r\n;"b;c"\r\n3;d\r\n'